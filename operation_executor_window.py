@@ -107,6 +107,18 @@ def parse_time_input(input_str):
 
     return None, None
 
+def resolve_timing(timing):
+    """Return (time_start, time_end, multiple_ranges) for a timing phrase, or None if it can't be parsed."""
+    if not timing:
+        return None, None, None
+    result = parse_time_input(timing)
+    if isinstance(result, tuple) and all(isinstance(i, datetime) for i in result):
+        return result[0], result[1], None
+    # An impossible date like "all files on 45 2024" gives an empty list, not a match-everything filter
+    if isinstance(result, list) and result:
+        return None, None, result
+    return None
+
 # ---------- GET ALL DRIVES ----------
 def get_all_drives():
     drives = []
@@ -120,7 +132,22 @@ def get_all_drives():
     return drives
 
 # ---------- WINDOWS SEARCH ----------
-def search_using_windows_index(name, search_type='both', time_start=None, time_end=None):
+def get_creation_time(path):
+    # getctime is the creation time only on Windows; elsewhere it is the inode change time
+    if platform.system() == "Windows":
+        return os.path.getctime(path)
+    return os.stat(path).st_birthtime
+
+def creation_time_supported():
+    return platform.system() == "Windows" or hasattr(os.stat(os.getcwd()), 'st_birthtime')
+
+TIME_PROPERTIES = {
+    'modified': ('System.DateModified', os.path.getmtime),
+    'created': ('System.DateCreated', get_creation_time),
+    'accessed': ('System.DateAccessed', os.path.getatime),
+}
+
+def search_using_windows_index(name, search_type='both', time_start=None, time_end=None, time_type='modified'):
     matches = []
     connection = win32com.client.Dispatch("ADODB.Connection")
     recordset = win32com.client.Dispatch("ADODB.Recordset")
@@ -135,12 +162,13 @@ def search_using_windows_index(name, search_type='both', time_start=None, time_e
     else:
         restriction = f"System.ItemNameDisplay LIKE '%{name}%'"
 
+    time_property = TIME_PROPERTIES.get(time_type, TIME_PROPERTIES['modified'])[0]
     if time_start and isinstance(time_start, datetime):
         iso_start = time_start.strftime("%Y-%m-%dT%H:%M:%S")
-        restriction += f" AND System.DateModified >= '{iso_start}'"
+        restriction += f" AND {time_property} >= '{iso_start}'"
     if time_end and isinstance(time_end, datetime):
         iso_end = time_end.strftime("%Y-%m-%dT%H:%M:%S")
-        restriction += f" AND System.DateModified < '{iso_end}'"
+        restriction += f" AND {time_property} < '{iso_end}'"
 
     query = f"SELECT System.ItemPathDisplay FROM SYSTEMINDEX WHERE {restriction}"
 
@@ -161,7 +189,8 @@ def search_using_windows_index(name, search_type='both', time_start=None, time_e
 EXCLUDED_DIRS = ['Windows', 'Program Files', 'Program Files (x86)', '$Recycle.Bin',
                  'System Volume Information', 'AppData', 'Microsoft']
 
-def search_in_drive(drive, name, search_type, time_start=None, time_end=None):
+def search_in_drive(drive, name, search_type, time_start=None, time_end=None, time_type='modified'):
+    get_time = TIME_PROPERTIES.get(time_type, TIME_PROPERTIES['modified'])[1]
     matches = []
     for root, dirs, files in os.walk(drive, topdown=True):
         dirs[:] = [d for d in dirs if not any(ex in d for ex in EXCLUDED_DIRS) and not d.startswith('$') and not d.startswith('.')]
@@ -171,7 +200,7 @@ def search_in_drive(drive, name, search_type, time_start=None, time_end=None):
                     full_path = os.path.join(root, d)
                     if name.lower() in d.lower():
                         if time_start or time_end:
-                            mod_time = datetime.fromtimestamp(os.path.getmtime(full_path))
+                            mod_time = datetime.fromtimestamp(get_time(full_path))
                             if (time_start and mod_time < time_start) or (time_end and mod_time >= time_end):
                                 continue
                         matches.append(full_path)
@@ -184,7 +213,7 @@ def search_in_drive(drive, name, search_type, time_start=None, time_end=None):
                     elif name.lower() not in f.lower():
                         continue
                     if time_start or time_end:
-                        mod_time = datetime.fromtimestamp(os.path.getmtime(full_path))
+                        mod_time = datetime.fromtimestamp(get_time(full_path))
                         if (time_start and mod_time < time_start) or (time_end and mod_time >= time_end):
                             continue
                     matches.append(full_path)
@@ -192,11 +221,11 @@ def search_in_drive(drive, name, search_type, time_start=None, time_end=None):
             continue
     return matches
 
-def search_with_os_walk(name, search_type='both', time_start=None, time_end=None):
+def search_with_os_walk(name, search_type='both', time_start=None, time_end=None, time_type='modified'):
     matches = []
     drives = get_all_drives()
     with ThreadPoolExecutor(max_workers=min(8, len(drives))) as executor:
-        futures = [executor.submit(search_in_drive, drive, name, search_type, time_start, time_end) for drive in drives]
+        futures = [executor.submit(search_in_drive, drive, name, search_type, time_start, time_end, time_type) for drive in drives]
         for future in as_completed(futures):
             try:
                 matches.extend(future.result())
@@ -205,20 +234,95 @@ def search_with_os_walk(name, search_type='both', time_start=None, time_end=None
     return matches
 
 # ---------- HYBRID SEARCH ----------
-def search_files_and_folders(name, search_type='both', time_start=None, time_end=None, multiple_ranges=None):
+def search_files_and_folders(name, search_type='both', time_start=None, time_end=None, multiple_ranges=None, time_type='modified'):
     results = []
     if multiple_ranges:
         for start, end in multiple_ranges:
-            part = search_files_and_folders(name, search_type, start, end)
+            part = search_files_and_folders(name, search_type, start, end, time_type=time_type)
             results.extend(part)
         return results
 
     if platform.system() == "Windows":
-        results = search_using_windows_index(name, search_type, time_start, time_end)
+        results = search_using_windows_index(name, search_type, time_start, time_end, time_type)
         if results:
             return results
         print("\u26a0\ufe0f Falling back to manual search...")
-    return search_with_os_walk(name, search_type, time_start, time_end)
+    return search_with_os_walk(name, search_type, time_start, time_end, time_type)
+
+# ---------- STRUCTURED SEARCH ----------
+SORT_KEYS = ('name', 'path', 'time')
+
+def sort_matches(matches, sort='name', descending=False, time_type='modified'):
+    if sort == 'path':
+        key = lambda path: path.lower()
+    elif sort == 'time':
+        get_time = TIME_PROPERTIES.get(time_type, TIME_PROPERTIES['modified'])[1]
+
+        def key(path):
+            try:
+                return get_time(path)
+            except OSError:
+                return 0
+    else:
+        key = lambda path: os.path.basename(path).lower()
+    return sorted(matches, key=key, reverse=descending)
+
+def search_with_timing(name, search_type=None, timing=None, time_type='modified', sort='name', descending=False):
+    try:
+        if search_type is None:
+            search_type = 'file' if name.startswith('.') else 'both'
+        if search_type not in ('file', 'folder', 'both'):
+            return {
+                "status": "error",
+                "message": f"Invalid search_type: '{search_type}'. Supported types: file, folder, both."
+            }
+        if time_type not in TIME_PROPERTIES:
+            return {
+                "status": "error",
+                "message": f"Invalid time_type: '{time_type}'. Supported types: {', '.join(TIME_PROPERTIES)}."
+            }
+        if time_type == 'created' and not creation_time_supported():
+            return {
+                "status": "error",
+                "message": "time_type 'created' is not supported on this platform."
+            }
+        if sort not in SORT_KEYS:
+            return {
+                "status": "error",
+                "message": f"Invalid sort: '{sort}'. Supported keys: {', '.join(SORT_KEYS)}."
+            }
+
+        time_range = resolve_timing(timing)
+        if time_range is None:
+            return {
+                "status": "error",
+                "message": f"Invalid timing format: '{timing}'. Supported formats: today, yesterday, last week, last month, specific dates, or date ranges."
+            }
+        time_start, time_end, multiple_ranges = time_range
+
+        matches = search_files_and_folders(name, search_type, time_start, time_end, multiple_ranges, time_type)
+        # Overlapping multiple_ranges can report the same path twice
+        matches = list(dict.fromkeys(matches))
+        matches = sort_matches(matches, sort, descending, time_type)
+
+        if not matches:
+            timing_info = f" with timing '{timing}'" if timing else ""
+            return {
+                "status": "not_found",
+                "message": f"❌ No files found matching '{name}'{timing_info}",
+                "matches": []
+            }
+        return {
+            "status": "success",
+            "message": f"🔍 Found {len(matches)} files matching '{name}'",
+            "matches": matches
+        }
+
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"❌ Error searching for {name}: {str(e)}"
+        }
 
 # ---------- FILE OPERATIONS ----------
 def open_path(path):
@@ -246,23 +350,13 @@ def copy_item(source, destination):
 # ---------- ENHANCED OPERATION EXECUTOR ----------
 def execute_operation_with_timing(operation, filename, timing=None):
     try:
-        time_start = None
-        time_end = None
-        multiple_ranges = None
-
-        if timing:
-            result = parse_time_input(timing)
-            if isinstance(result, tuple) and all(isinstance(i, datetime) for i in result):
-                time_start, time_end = result
-                multiple_ranges = None
-            elif isinstance(result, list):
-                time_start = time_end = None
-                multiple_ranges = result
-            else:
-                return {
-                    "status": "error",
-                    "message": f"Invalid timing format: '{timing}'. Supported formats: today, yesterday, last week, last month, specific dates, or date ranges."
-                }
+        time_range = resolve_timing(timing)
+        if time_range is None:
+            return {
+                "status": "error",
+                "message": f"Invalid timing format: '{timing}'. Supported formats: today, yesterday, last week, last month, specific dates, or date ranges."
+            }
+        time_start, time_end, multiple_ranges = time_range
 
         search_type = 'both'
         if filename.startswith('.'):
@@ -359,19 +453,11 @@ def main():
             continue
 
         time_input = input("Filter by time? (e.g., today / yesterday / last week / last month / 'files on 8 January 2025' / 'from June 2024 to July 2024' / 'all files on 8th 2024' / none): ").strip().lower()
-        if time_input == 'none':
-            time_start = time_end = multiple_ranges = None
-        else:
-            result = parse_time_input(time_input)
-            if isinstance(result, tuple) and all(isinstance(i, datetime) for i in result):
-                time_start, time_end = result
-                multiple_ranges = None
-            elif isinstance(result, list):
-                time_start = time_end = None
-                multiple_ranges = result
-            else:
-                print("\u274c Invalid time input.")
-                continue
+        time_range = resolve_timing(None if time_input == 'none' else time_input)
+        if not time_input or time_range is None:
+            print("\u274c Invalid time input.")
+            continue
+        time_start, time_end, multiple_ranges = time_range
 
         search_type = 'both'
         matches = search_files_and_folders(name, search_type, time_start, time_end, multiple_ranges)
@@ -0,0 +1,35 @@
+import os
+import uuid
+from collections import OrderedDict
+
+# ✅ Cursor store for /search continuation: cursor -> {"matches": [...], "offset": n}
+search_cursors = OrderedDict()
+MAX_SEARCH_CURSORS = 32
+MAX_PAGE_SIZE = 500
+
+def build_search_page(matches, offset, page_size):
+    page = matches[offset:offset + page_size]
+    next_offset = offset + len(page)
+    next_cursor = None
+    if next_offset < len(matches):
+        # Each page gets its own cursor so a client can safely retry a request
+        next_cursor = uuid.uuid4().hex
+        search_cursors[next_cursor] = {"matches": matches, "offset": next_offset}
+        while len(search_cursors) > MAX_SEARCH_CURSORS:
+            search_cursors.popitem(last=False)
+
+    return {
+        "status": "success",
+        "total": len(matches),
+        "offset": offset,
+        "results": [{"path": path, "name": os.path.basename(path)} for path in page],
+        "next_cursor": next_cursor
+    }
+
+def continue_search(cursor, page_size):
+    """Return the page behind a cursor, or None if it is unknown or has been evicted."""
+    state = search_cursors.get(cursor)
+    if state is None:
+        return None
+    search_cursors.move_to_end(cursor)
+    return build_search_page(state["matches"], state["offset"], page_size)
@@ -2,7 +2,9 @@ import google.generativeai as genai
 import json
 import os
 import operation_executor_window  # Updated to use the enhanced version
+import search_pagination
 from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 import uvicorn
 
@@ -245,6 +247,59 @@ async def chat_endpoint(request: Request):
     response = handle_input(user_message)
     return {"response": response}
 
+# --- Structured search, no Gemini round-trip ---
+def remember_search_page(page):
+    for item in page["results"]:
+        file_context[item["name"]] = item["path"]
+    return page
+
+@app.get("/search")
+async def search_endpoint(
+    name: str = None,
+    search_type: str = None,
+    timing: str = None,
+    time_type: str = None,
+    sort: str = None,
+    order: str = None,
+    page_size: int = 50,
+    cursor: str = None
+):
+    max_page_size = search_pagination.MAX_PAGE_SIZE
+    if not 1 <= page_size <= max_page_size:
+        return JSONResponse({"status": "error", "message": f"page_size must be between 1 and {max_page_size}."}, status_code=400)
+
+    # A cursor keeps the query and sort of the request that created it; only page_size may change
+    if cursor:
+        if any(param is not None for param in (name, search_type, timing, time_type, sort, order)):
+            return JSONResponse({"status": "error", "message": "A cursor cannot be combined with search parameters; only page_size may change."}, status_code=400)
+        page = search_pagination.continue_search(cursor, page_size)
+        if page is None:
+            return JSONResponse({"status": "error", "message": "Unknown or expired cursor."}, status_code=404)
+        return remember_search_page(page)
+
+    if not name:
+        return JSONResponse({"status": "error", "message": "No name provided."}, status_code=400)
+    order = order or "asc"
+    if order not in ("asc", "desc"):
+        return JSONResponse({"status": "error", "message": f"Invalid order: '{order}'. Supported orders: asc, desc."}, status_code=400)
+
+    result = await run_in_threadpool(
+        operation_executor_window.search_with_timing,
+        name, search_type, timing, time_type or "modified", sort or "name", order == "desc"
+    )
+    if result["status"] == "error":
+        return JSONResponse(result, status_code=400)
+    if result["status"] == "not_found":
+        return {
+            "status": "not_found",
+            "message": result["message"],
+            "total": 0,
+            "offset": 0,
+            "results": [],
+            "next_cursor": None
+        }
+    return remember_search_page(search_pagination.build_search_page(result["matches"], 0, page_size))
+
 if __name__ == "__main__":
     uvicorn.run("smart_chatbot:app", host="127.0.0.1", port=5005, reload=False)
 
@@ -0,0 +1,77 @@
+import pytest
+
+import search_pagination
+
+
+@pytest.fixture(autouse=True)
+def clear_cursors():
+    search_pagination.search_cursors.clear()
+    yield
+    search_pagination.search_cursors.clear()
+
+
+def test_first_page_returns_next_cursor():
+    matches = [f"/files/report{i}.txt" for i in range(5)]
+    page = search_pagination.build_search_page(matches, 0, 2)
+
+    assert page["total"] == 5
+    assert page["offset"] == 0
+    assert [item["name"] for item in page["results"]] == ["report0.txt", "report1.txt"]
+    assert page["next_cursor"] in search_pagination.search_cursors
+
+
+def test_last_page_has_no_next_cursor():
+    matches = ["/files/a.txt", "/files/b.txt"]
+    page = search_pagination.build_search_page(matches, 0, 2)
+
+    assert page["next_cursor"] is None
+    assert not search_pagination.search_cursors
+
+
+def test_cursor_walks_through_all_pages():
+    matches = [f"/files/report{i}.txt" for i in range(5)]
+    page = search_pagination.build_search_page(matches, 0, 2)
+    seen = [item["path"] for item in page["results"]]
+    while page["next_cursor"]:
+        page = search_pagination.continue_search(page["next_cursor"], 2)
+        seen.extend(item["path"] for item in page["results"])
+
+    assert seen == matches
+
+
+def test_retrying_a_cursor_returns_the_same_page():
+    matches = [f"/files/report{i}.txt" for i in range(5)]
+    cursor = search_pagination.build_search_page(matches, 0, 2)["next_cursor"]
+
+    first = search_pagination.continue_search(cursor, 2)
+    retry = search_pagination.continue_search(cursor, 2)
+
+    assert first["offset"] == retry["offset"] == 2
+    assert first["results"] == retry["results"]
+    assert first["next_cursor"] != retry["next_cursor"]
+
+
+def test_unknown_cursor_returns_none():
+    assert search_pagination.continue_search("missing", 10) is None
+
+
+def test_oldest_cursor_is_evicted_after_max():
+    matches = ["/files/a.txt", "/files/b.txt"]
+    oldest = search_pagination.build_search_page(matches, 0, 1)["next_cursor"]
+    for _ in range(search_pagination.MAX_SEARCH_CURSORS):
+        search_pagination.build_search_page(matches, 0, 1)
+
+    assert len(search_pagination.search_cursors) == search_pagination.MAX_SEARCH_CURSORS
+    assert search_pagination.continue_search(oldest, 1) is None
+
+
+def test_used_cursor_is_kept_over_older_ones():
+    matches = ["/files/a.txt", "/files/b.txt"]
+    kept = search_pagination.build_search_page(matches, 0, 1)["next_cursor"]
+    evicted = search_pagination.build_search_page(matches, 0, 1)["next_cursor"]
+    search_pagination.continue_search(kept, 1)
+    for _ in range(search_pagination.MAX_SEARCH_CURSORS - 1):
+        search_pagination.build_search_page(matches, 0, 1)
+
+    assert search_pagination.continue_search(evicted, 1) is None
+    assert search_pagination.continue_search(kept, 1) is not None